@@ -6,27 +6,60 @@ Monitors download queue for failures and attempts to download from alternative s
 
 __version__ = "1.1.3"
 
+import atexit
+import functools
+import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import shutil
+import sqlite3
 import time
 import logging
+import random
 import re
-from difflib import SequenceMatcher
+import string
+import sys
+import types
 import requests
+from rapidfuzz import fuzz, process
+
+# orjson parses large downloadStatus payloads several times faster than the
+# stdlib; the script works fine without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # CONFIGURATION - Edit these settings to match your setup
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _env(name: str, default: str, cast=str):
+    """Read and convert an environment variable, caching the parsed result.
+
+    Repeat lookups hit the lru_cache instead of re-traversing os.environ
+    and re-running the conversion.
+    """
+    value = os.environ.get(name, default)
+    if cast is int:
+        # isdigit gate keeps the happy path on the cheap C conversion and
+        # falls back to the default on malformed input instead of raising
+        return int(value) if value and value.lstrip("-").isdigit() else int(default)
+    return cast(value)
+
+
 # Connection Settings
-SUWAYOMI_URL = os.environ.get("SUWAYOMI_URL", "http://localhost:4567/api/graphql")
-USERNAME = os.environ.get("SUWAYOMI_USER", "username")
-PASSWORD = os.environ.get("SUWAYOMI_PASS", "password")
+SUWAYOMI_URL = _env("SUWAYOMI_URL", "http://localhost:4567/api/graphql")
+USERNAME = _env("SUWAYOMI_USER", "username")
+PASSWORD = _env("SUWAYOMI_PASS", "password")
 
 # File System Settings
-DOWNLOADS_PATH = os.environ.get("DOWNLOADS_PATH", "/downloads/mangas")
-CHOWN_UID = int(os.environ.get("CHOWN_UID", "1000"))  # User ID for file ownership
-CHOWN_GID = int(os.environ.get("CHOWN_GID", "1000"))  # Group ID for file ownership
+DOWNLOADS_PATH = _env("DOWNLOADS_PATH", "/downloads/mangas")
+CHOWN_UID = _env("CHOWN_UID", "1000", int)  # User ID for file ownership
+CHOWN_GID = _env("CHOWN_GID", "1000", int)  # Group ID for file ownership
 
 # Source Priority
 # List of source IDs to try in order (most reliable first).
@@ -44,61 +77,74 @@ _default_sources = [
     "4972933717624256217",   # Comick (EN)
 ]
 
-SOURCE_PRIORITY = os.environ.get("SOURCE_PRIORITY", "").split(",") if os.environ.get("SOURCE_PRIORITY") else _default_sources
-SOURCE_PRIORITY = [s.strip() for s in SOURCE_PRIORITY if s.strip()]  # Clean up whitespace
+# Clean up whitespace (stripping each token exactly once) and freeze:
+# interned IDs make the downstream dict lookups hit the pointer-compare
+# fast path, and a tuple can't be mutated out from under the retry loops
+_raw_priority = os.environ.get("SOURCE_PRIORITY")
+SOURCE_PRIORITY = tuple(
+    sys.intern(s) for s in filter(None, (s.strip() for s in _raw_priority.split(",")))
+) if _raw_priority else tuple(sys.intern(s) for s in _default_sources)
 
 # Filename Patterns per Source
 # Define how each source names its downloaded files.
+# Transforms are str.translate tables (a single C pass per filename);
+# None means no transform and skips the call entirely.
+_COLON_TO_UNDERSCORE = str.maketrans({":": "_"})
+
 # Default patterns for known sources
 _default_patterns = {
     "4215511432986138970": {  # Mangabat
         "prefix": "www.mangabats.com_",
-        "transform": lambda name: name,
+        "translate_table": None,
     },
     "6084907896154116083": {  # MangaFire
         "prefix": "",
-        "transform": lambda name: name.replace(":", "_"),
+        "translate_table": _COLON_TO_UNDERSCORE,
     },
     "2528986671771677900": {  # Mangakakalot
         "prefix": "www.mangakakalot.gg_",
-        "transform": lambda name: name,
+        "translate_table": None,
     },
 }
 
-# Parse custom patterns from environment variable
+# Custom patterns come from an environment variable
 # Format: SOURCE_ID:PREFIX:TRANSFORM_TYPE,SOURCE_ID2:PREFIX2:TRANSFORM_TYPE2
 # TRANSFORM_TYPE can be: none, colon_to_underscore
-SOURCE_FILENAME_PATTERNS = _default_patterns.copy()
-custom_patterns = os.environ.get("SOURCE_FILENAME_PATTERNS", "")
-if custom_patterns:
-    for pattern_str in custom_patterns.split(","):
-        pattern_str = pattern_str.strip()
-        if not pattern_str:
-            continue
-        parts = pattern_str.split(":")
-        if len(parts) >= 2:
-            source_id = parts[0].strip()
-            prefix = parts[1].strip()
+@functools.lru_cache(maxsize=None)
+def _filename_patterns() -> dict:
+    """Build the filename-pattern table on first use (defaults + env overrides)."""
+    patterns = _default_patterns.copy()
+    custom_patterns = os.environ.get("SOURCE_FILENAME_PATTERNS", "")
+    if custom_patterns:
+        # Strip each entry exactly once and bound the colon split at 3 parts
+        entries = [e for e in map(str.strip, custom_patterns.split(",")) if e]
+        for parts in (e.split(":", 2) for e in entries):
+            if len(parts) < 2:
+                continue
             transform_type = parts[2].strip() if len(parts) > 2 else "none"
-            
-            # Define transform based on type (capture value with default arg)
-            if transform_type == "colon_to_underscore":
-                transform = lambda name, tt=transform_type: name.replace(":", "_")
-            else:
-                transform = lambda name, tt=transform_type: name
-            
-            SOURCE_FILENAME_PATTERNS[source_id] = {
-                "prefix": prefix,
-                "transform": transform
+            patterns[parts[0].strip()] = {
+                "prefix": parts[1].strip(),
+                "translate_table": _COLON_TO_UNDERSCORE if transform_type == "colon_to_underscore" else None
             }
+    # Frozen, with interned source-ID keys (see SOURCE_PRIORITY above)
+    return types.MappingProxyType({sys.intern(k): v for k, v in patterns.items()})
+
+
+def __getattr__(name):
+    # PEP 562: SOURCE_FILENAME_PATTERNS stays a module attribute but is only
+    # built (env parsing included) on first access
+    if name == "SOURCE_FILENAME_PATTERNS":
+        return _filename_patterns()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Monitoring Settings
-CHECK_INTERVAL = int(os.environ.get("CHECK_INTERVAL", "60"))  # How often to check for failed downloads (seconds)
+CHECK_INTERVAL = _env("CHECK_INTERVAL", "60", int)  # How often to check for failed downloads (seconds)
 TITLE_MATCH_THRESHOLD = 0.85  # Minimum similarity score (0-1) to match manga titles
 DOWNLOAD_WAIT_TIMEOUT = 300  # Maximum time to wait for a download to complete (seconds)
 DOWNLOAD_CHECK_INTERVAL = 5  # How often to check download progress (seconds)
-MAX_CONCURRENT_FALLBACKS = int(os.environ.get("MAX_CONCURRENT_FALLBACKS", "3"))  # Max parallel fallback downloads
-MAX_SOURCE_RETRY_LOOPS = int(os.environ.get("MAX_SOURCE_RETRY_LOOPS", "3"))  # How many times to loop through all sources before giving up
+MAX_CONCURRENT_FALLBACKS = _env("MAX_CONCURRENT_FALLBACKS", "3", int)  # Max parallel fallback downloads
+MAX_SOURCE_RETRY_LOOPS = _env("MAX_SOURCE_RETRY_LOOPS", "3", int)  # How many times to loop through all sources before giving up
+CHECK_FOR_UPDATES = _env("CHECK_FOR_UPDATES", "1").lower() not in ("0", "false", "no")  # Check GitHub for newer releases on startup
 
 # ============================================================================
 # END CONFIGURATION
@@ -110,17 +156,254 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Cache for source names and reverse lookup
+# Shared HTTP session so GraphQL calls reuse keep-alive connections
+# instead of paying a TCP/TLS handshake per request
+_session = requests.Session()
+_session.auth = (USERNAME, PASSWORD)
+_session.headers.update({"Content-Type": "application/json"})
+# Transport retries cover connection setup only (read=0: a request that may
+# already have reached the server is never replayed here); 5xx responses and
+# timeouts are left to graphql_request's jittered backoff loop, which knows
+# which mutations must not be replayed
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_CONCURRENT_FALLBACKS * 2,
+    max_retries=requests.adapters.Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.2
+    )
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Cache for source names and reverse lookup. Entries are refreshed after
+# _SOURCE_NAME_TTL so renamed extensions are picked up without a restart;
+# failed lookups are never cached, so a source that was briefly unreachable
+# is retried on the next call.
 _source_name_cache = {}
 _source_id_by_name_cache = {}
+_source_name_fetched_at = {}
+_SOURCE_NAME_TTL = 3600  # seconds
+
+# On-disk copy of the source-name cache so restarts don't re-fetch every
+# source name over GraphQL. Refreshed after the TTL so renamed or newly
+# installed sources are eventually picked up.
+_SOURCE_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "suwayomi_fb", "sources.json"
+)
+_SOURCE_CACHE_TTL = 7 * 24 * 3600  # 7 days
+
+
+def _load_source_cache() -> None:
+    """Warm the source-name caches from disk (best effort)."""
+    try:
+        with open(_SOURCE_CACHE_FILE) as f:
+            data = json.load(f)
+        if time.time() - data.get("timestamp", 0) > _SOURCE_CACHE_TTL:
+            return
+        names = data.get("names", {})
+        _source_name_cache.update(names)
+        _source_id_by_name_cache.update({name: sid for sid, name in names.items()})
+        loaded_at = data.get("timestamp", 0)
+        _source_name_fetched_at.update({sid: loaded_at for sid in names})
+    except Exception:
+        pass
+
+
+def _save_source_cache() -> None:
+    """Write the source-name cache to disk (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(_SOURCE_CACHE_FILE), exist_ok=True)
+        with open(_SOURCE_CACHE_FILE, "w") as f:
+            json.dump({"timestamp": time.time(), "names": _source_name_cache}, f)
+    except Exception as e:
+        logger.debug(f"Could not persist source cache: {e}")
+
+
+_load_source_cache()
 
 # Active fallback downloads tracking
 # Format: {chapter_id: {"source_id": str, "manga_title": str, "chapter_name": str, "start_time": float, "dest_source_id": str}}
 _active_fallback_downloads = {}
 
-# Track which sources have been tried for each failure
-# Format: {"manga_id_chapter_id": [source_id1, source_id2, ...]}
-_tried_sources = {}
+# Concurrency gate for fallback downloads: a slot is acquired when a
+# fallback starts and released when it leaves _active_fallback_downloads
+_fallback_slots = threading.BoundedSemaphore(MAX_CONCURRENT_FALLBACKS)
+
+# Resolved destination source per failure key. resolve_destination_source_id
+# can override the original source, and the override is what gets excluded
+# from the candidate list, so the main loop's exhaustion check must subtract
+# the same id. Entries are dropped together with tried_sources_per_failure.
+_dest_source_by_failure = {}
+
+
+class _LRUSet:
+    """Bounded set that evicts the oldest entries one at a time.
+
+    Used for the processed-failures bookkeeping so old entries age out
+    gracefully instead of the whole set being flushed at once (which would
+    cause already-handled failures to be re-attempted).
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def add(self, key) -> None:
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key) -> None:
+        self._entries.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Processed-failure keys persisted across restarts (same cache dir as the
+# source-name cache); entries older than this are pruned at startup
+_FAILURES_DB_FILE = os.path.join(os.path.dirname(_SOURCE_CACHE_FILE), "failures.db")
+_PROCESSED_RETENTION = 7 * 24 * 3600  # seconds
+
+
+class _ProcessedStore:
+    """Set of handled failure keys backed by SQLite.
+
+    Survives container restarts, so chapters that were already recovered
+    (or exhausted) aren't rediscovered and re-attempted from scratch. WAL
+    with synchronous=NORMAL keeps the per-key insert cheap; stale keys are
+    aged out by timestamp rather than dropping the whole set at a size cap.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._con = sqlite3.connect(path, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.execute("CREATE TABLE IF NOT EXISTS processed (key TEXT PRIMARY KEY, ts REAL)")
+        self._con.execute("DELETE FROM processed WHERE ts < ?", (time.time() - _PROCESSED_RETENTION,))
+
+    def add(self, key: str) -> None:
+        self._con.execute("INSERT OR REPLACE INTO processed VALUES (?, ?)", (key, time.time()))
+
+    def discard(self, key: str) -> None:
+        self._con.execute("DELETE FROM processed WHERE key = ?", (key,))
+
+    def __contains__(self, key: str) -> bool:
+        return self._con.execute("SELECT 1 FROM processed WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._con.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+
+
+def _processed_failures_store():
+    """Open the persistent processed-failure store, falling back to memory.
+
+    A read-only cache directory (or any other SQLite failure) degrades to
+    the in-process LRU set rather than stopping the downloader.
+    """
+    try:
+        return _ProcessedStore(_FAILURES_DB_FILE)
+    except Exception as e:
+        logger.warning(f"Could not open {_FAILURES_DB_FILE} ({e}); processed failures won't survive restarts")
+        return _LRUSet(maxsize=4096)
+
+
+def _ttl_cache(maxsize: int, ttl: float):
+    """lru_cache-style decorator whose entries expire after ttl seconds.
+
+    Thread-safe, since cached functions are also called from the search
+    thread pool. Concurrent misses for the same key are single-flighted:
+    one caller performs the underlying call while the rest wait for its
+    result, so e.g. several failed chapters of the same manga trigger one
+    source search instead of one each.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        inflight = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.time()
+            with lock:
+                hit = cache.get(args)
+                if hit is not None and now - hit[0] < ttl:
+                    cache.move_to_end(args)
+                    return hit[1]
+                event = inflight.get(args)
+                if event is None:
+                    event = inflight[args] = threading.Event()
+                    leader = True
+                else:
+                    leader = False
+
+            if not leader:
+                event.wait()
+                with lock:
+                    hit = cache.get(args)
+                    if hit is not None:
+                        return hit[1]
+                # The leader failed to cache anything (raised); fall through
+                # and make our own attempt rather than returning nothing
+
+            try:
+                result = fn(*args)
+                with lock:
+                    cache[args] = (time.time(), result)
+                    cache.move_to_end(args)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+                return result
+            finally:
+                if leader:
+                    with lock:
+                        inflight.pop(args, None)
+                    event.set()
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+# Directory listing cache shared across ticks, invalidated by directory
+# mtime. Format: {path: (st_mtime_ns, [os.DirEntry, ...])}
+_dir_cache = {}
+
+
+def _cached_scandir(path: str) -> list:
+    """Directory entries cached until the directory's mtime changes.
+
+    In steady state a lookup costs one stat() on the directory itself;
+    the entries only get re-scanned when something was added or removed.
+    os.scandir returns DirEntry objects whose is_dir()/is_file() use the
+    type reported by the directory, avoiding a stat() per entry.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _dir_cache.pop(path, None)
+        raise
+    cached = _dir_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with os.scandir(path) as it:
+        entries = list(it)
+    _dir_cache[path] = (mtime_ns, entries)
+    return entries
 
 
 def check_for_updates() -> None:
@@ -158,27 +441,59 @@ def check_for_updates() -> None:
         logger.debug(f"Could not check for updates: {e}")
 
 
-def graphql_request(query: str, variables: dict = None) -> dict:
-    """Make a GraphQL request to Suwayomi."""
+# Backoff parameters for graphql_request. Transient server trouble (5xx,
+# timeouts, refused connections) is retried with exponential backoff plus
+# jitter so concurrent workers don't hammer Suwayomi in lockstep during an
+# outage. 4xx responses are never retried - they won't get better.
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+
+
+def graphql_request(query: str, variables: dict = None, retries: int = 4) -> dict:
+    """Make a GraphQL request to Suwayomi.
+
+    Retries transient failures (timeouts, connection errors, 5xx) up to
+    `retries` times with exponential backoff and jitter. Mutations that must
+    not be replayed blindly can pass a lower `retries`.
+    """
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
 
-    response = requests.post(
-        SUWAYOMI_URL,
-        json=payload,
-        auth=(USERNAME, PASSWORD),
-        headers={"Content-Type": "application/json"},
-        timeout=30
-    )
-    response.raise_for_status()
-    return response.json()
+    attempt = 0
+    while True:
+        try:
+            response = _session.post(
+                SUWAYOMI_URL,
+                json=payload,
+                timeout=30
+            )
+            if response.status_code < 500:
+                response.raise_for_status()
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+            # 5xx: fall through to the retry path below
+            error = requests.exceptions.HTTPError(
+                f"{response.status_code} Server Error for {SUWAYOMI_URL}",
+                response=response,
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            error = e
+
+        if attempt >= retries:
+            raise error
+        delay = min(_BACKOFF_CAP, _BACKOFF_BASE * (2 ** attempt)) + random.random() * _BACKOFF_BASE
+        logger.debug(f"GraphQL request failed ({error}), retrying in {delay:.1f}s")
+        time.sleep(delay)
+        attempt += 1
 
 
 def get_source_name(source_id: str) -> str:
-    """Get source name by ID (cached)."""
-    if source_id in _source_name_cache:
-        return _source_name_cache[source_id]
+    """Get source name by ID (cached, refreshed after _SOURCE_NAME_TTL)."""
+    cached = _source_name_cache.get(source_id)
+    if cached is not None and time.time() - _source_name_fetched_at.get(source_id, 0) < _SOURCE_NAME_TTL:
+        return cached
 
     query = """
     query GET_SOURCE($id: LongString!) {
@@ -190,19 +505,56 @@ def get_source_name(source_id: str) -> str:
     """
     try:
         result = graphql_request(query, {"id": source_id})
-        name = result.get("data", {}).get("source", {}).get("displayName", f"Unknown ({source_id})")
+        name = (result.get("data", {}).get("source") or {}).get("displayName")
+        if not name:
+            # Don't cache the failure; the source may just not be loaded yet
+            return cached or f"Unknown ({source_id})"
         _source_name_cache[source_id] = name
         _source_id_by_name_cache[name] = source_id
+        _source_name_fetched_at[source_id] = time.time()
+        _save_source_cache()
         return name
     except Exception:
-        return f"Unknown ({source_id})"
+        # A stale name beats no name while Suwayomi is unreachable
+        return cached or f"Unknown ({source_id})"
 
 
-def get_source_id_by_name(display_name: str) -> str | None:
-    """Reverse lookup: display name -> source id."""
-    if display_name in _source_id_by_name_cache:
-        return _source_id_by_name_cache[display_name]
-    # As a fallback, try fetching all sources via extensions listing
+def prefetch_source_names(source_ids: list) -> None:
+    """Fetch display names for several sources in one aliased GraphQL request.
+
+    Avoids issuing an individual source(id:...) round trip per entry of
+    SOURCE_PRIORITY when the caches are cold.
+    """
+    missing = [sid for sid in source_ids if sid and sid not in _source_name_cache]
+    if not missing:
+        return
+
+    aliases = "\n".join(
+        f's{i}: source(id: "{sid}") {{ id displayName }}'
+        for i, sid in enumerate(missing)
+    )
+    query = "query {\n" + aliases + "\n}"
+    try:
+        result = graphql_request(query)
+        now = time.time()
+        for node in (result.get("data") or {}).values():
+            if node and node.get("displayName"):
+                _source_name_cache[node["id"]] = node["displayName"]
+                _source_id_by_name_cache[node["displayName"]] = node["id"]
+                _source_name_fetched_at[node["id"]] = now
+        _save_source_cache()
+    except Exception as e:
+        logger.debug(f"Could not prefetch source names: {e}")
+
+
+def _prime_source_caches() -> bool:
+    """Fill both source-name caches from one extensions listing.
+
+    Called at startup so the forward and reverse name lookups during
+    failure processing are plain dict hits instead of on-demand GraphQL
+    round trips; also serves as the fallback path for reverse lookups
+    that miss the cache.
+    """
     query = """
     query {
       extensions {
@@ -216,12 +568,26 @@ def get_source_id_by_name(display_name: str) -> str | None:
     try:
         res = graphql_request(query)
         nodes = res.get("data", {}).get("extensions", {}).get("nodes", [])
+        now = time.time()
         for node in nodes:
             _source_name_cache[node["id"]] = node["displayName"]
             _source_id_by_name_cache[node["displayName"]] = node["id"]
+            _source_name_fetched_at[node["id"]] = now
+        _save_source_cache()
+        return True
+    except Exception as e:
+        logger.debug(f"Could not prime source caches: {e}")
+        return False
+
+
+def get_source_id_by_name(display_name: str) -> str | None:
+    """Reverse lookup: display name -> source id."""
+    if display_name in _source_id_by_name_cache:
+        return _source_id_by_name_cache[display_name]
+    # As a fallback, refresh from the full extensions listing
+    if _prime_source_caches():
         return _source_id_by_name_cache.get(display_name)
-    except Exception:
-        return None
+    return None
 
 
 def get_source_folder(source_id: str) -> str:
@@ -229,12 +595,55 @@ def get_source_folder(source_id: str) -> str:
     return get_source_name(source_id)
 
 
+# Filenames Suwayomi expects per chapter id; name/scanlator never change
+# for a given chapter, so entries stay valid for the process lifetime
+_expected_filename_cache = {}
+
+
+def _build_expected_filename(name: str, scanlator: str | None) -> str:
+    """Build a chapter filename exactly as Suwayomi does (see getChapterDir in DirName.kt)."""
+    if scanlator:
+        return f"{scanlator}_{name}.cbz"
+    return f"{name}.cbz"
+
+
+def prefetch_expected_filenames(chapter_ids: list) -> None:
+    """Resolve Suwayomi's expected filenames for several chapters in one query.
+
+    Populates _expected_filename_cache via a single aliased request, so
+    finalizing a batch of completed fallbacks costs one round trip
+    instead of one per chapter.
+    """
+    missing = [cid for cid in chapter_ids if cid not in _expected_filename_cache]
+    if not missing:
+        return
+
+    aliases = "\n".join(
+        f"c{i}: chapter(id: {cid}) {{ id name scanlator }}"
+        for i, cid in enumerate(missing)
+    )
+    query = "query {\n" + aliases + "\n}"
+    try:
+        result = graphql_request(query)
+        for chapter in (result.get("data") or {}).values():
+            if chapter:
+                _expected_filename_cache[chapter["id"]] = _build_expected_filename(
+                    chapter.get("name", ""), chapter.get("scanlator")
+                )
+    except Exception as e:
+        logger.debug(f"Could not prefetch expected filenames: {e}")
+
+
 def get_suwayomi_expected_filename(chapter_id: int) -> str:
     """Get the EXACT filename Suwayomi expects based on its database.
-    
+
     Suwayomi builds filenames as: {scanlator}_{name}.cbz or just {name}.cbz if no scanlator.
     This must match exactly or Suwayomi won't detect the file.
     """
+    cached = _expected_filename_cache.get(chapter_id)
+    if cached is not None:
+        return cached
+
     query = """
     query GET_CHAPTER($id: Int!) {
         chapter(id: $id) {
@@ -247,15 +656,8 @@ def get_suwayomi_expected_filename(chapter_id: int) -> str:
     try:
         result = graphql_request(query, {"id": chapter_id})
         chapter = result.get("data", {}).get("chapter", {})
-        name = chapter.get("name", "")
-        scanlator = chapter.get("scanlator")
-        
-        # Build filename exactly as Suwayomi does (see getChapterDir in DirName.kt)
-        if scanlator:
-            filename = f"{scanlator}_{name}.cbz"
-        else:
-            filename = f"{name}.cbz"
-        
+        filename = _build_expected_filename(chapter.get("name", ""), chapter.get("scanlator"))
+        _expected_filename_cache[chapter_id] = filename
         return filename
     except Exception as e:
         logger.warning(f"Could not get expected filename for chapter {chapter_id}: {e}")
@@ -268,50 +670,125 @@ def get_filename_for_source(source_id: str, chapter_name: str) -> str:
     NOTE: This is only used for alt sources. For the destination (original) source,
     use get_suwayomi_expected_filename() instead to match Suwayomi's exact expectations.
     """
-    pattern = SOURCE_FILENAME_PATTERNS.get(source_id, {"prefix": "", "transform": lambda x: x})
+    pattern = _filename_patterns().get(source_id, {"prefix": "", "translate_table": None})
     prefix = pattern["prefix"]
-    transformed_name = pattern["transform"](chapter_name)
+    table = pattern["translate_table"]
+    transformed_name = chapter_name.translate(table) if table else chapter_name
     return f"{prefix}{transformed_name}.cbz"
 
 
-def get_failed_downloads() -> list:
-    """Get all downloads in ERROR state."""
+# A queue snapshot this recent is served from cache, so the main loop,
+# check_active_downloads and any wait_for_download pollers that fire within
+# the same window share one downloadStatus roundtrip instead of each
+# issuing their own.
+_QUEUE_SNAPSHOT_TTL = 2.0
+_queue_cache = {"ts": 0.0, "queue": []}
+_queue_cache_lock = threading.Lock()
+
+
+def get_download_queue() -> list:
+    """Fetch the full download queue (snapshot cached for ~2s).
+
+    Carries everything both the active-download tracking and the ERROR
+    filtering need, so the main loop fetches it once per tick instead of
+    issuing overlapping downloadStatus queries.
+    """
+    with _queue_cache_lock:
+        if time.time() - _queue_cache["ts"] < _QUEUE_SNAPSHOT_TTL:
+            return _queue_cache["queue"]
+
     query = """
     {
         downloadStatus {
             queue {
                 manga { id title sourceId }
-                chapter { id name chapterNumber }
+                chapter { id name chapterNumber scanlator }
                 state
-                tries
+                progress
             }
         }
     }
     """
     result = graphql_request(query)
     queue = result.get("data", {}).get("downloadStatus", {}).get("queue", [])
-    return [item for item in queue if item["state"] == "ERROR"]
+    with _queue_cache_lock:
+        _queue_cache["ts"] = time.time()
+        _queue_cache["queue"] = queue
+    return queue
+
+
+def get_failed_downloads(queue: list = None) -> list:
+    """Get all downloads in ERROR state.
+
+    Each item carries its failure key under "_key" so the main loop's
+    membership checks don't re-format the same string several times per
+    item per tick.
+    """
+    if queue is None:
+        queue = get_download_queue()
+    failed = [item for item in queue if item["state"] == "ERROR"]
+    for item in failed:
+        if "_key" not in item:
+            item["_key"] = f"{item['manga']['id']}_{item['chapter']['id']}"
+    return failed
 
 
 def get_download_status() -> list:
-    """Get current download queue."""
-    query = """
-    {
-        downloadStatus {
-            queue {
-                chapter { id }
-                state
-                progress
-            }
-        }
-    }
+    """Get current download queue (shares the cached snapshot)."""
+    return get_download_queue()
+
+
+class _SourceBreaker:
+    """Per-source circuit breaker.
+
+    Tracks consecutive search failures per source id. After FAILURE_THRESHOLD
+    failures the breaker opens and allow() rejects the source for
+    OPEN_DURATION seconds, so a dead source doesn't cost every failed
+    download a full request timeout. Once the cooldown elapses a single
+    probe is let through (half-open); success closes the breaker, another
+    failure re-opens it for a fresh cooldown.
     """
-    result = graphql_request(query)
-    return result.get("data", {}).get("downloadStatus", {}).get("queue", [])
+
+    FAILURE_THRESHOLD = 5
+    OPEN_DURATION = 300  # seconds
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = {}   # source_id -> consecutive failure count
+        self._opened_at = {}  # source_id -> time the breaker tripped
+
+    def allow(self, source_id: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(source_id)
+            if opened_at is None:
+                return True
+            # Half-open: permit one probe after the cooldown; a failure
+            # refreshes _opened_at, a success clears it.
+            return time.time() - opened_at >= self.OPEN_DURATION
+
+    def record_failure(self, source_id: str) -> None:
+        with self._lock:
+            count = self._failures.get(source_id, 0) + 1
+            self._failures[source_id] = count
+            if count >= self.FAILURE_THRESHOLD or source_id in self._opened_at:
+                self._opened_at[source_id] = time.time()
+                logger.warning(
+                    f"Source {source_id} circuit opened after {count} consecutive failures; "
+                    f"skipping it for {self.OPEN_DURATION}s"
+                )
+
+    def record_success(self, source_id: str) -> None:
+        with self._lock:
+            self._failures.pop(source_id, None)
+            self._opened_at.pop(source_id, None)
 
 
+_source_breaker = _SourceBreaker()
+
+
+@_ttl_cache(maxsize=256, ttl=300)
 def search_manga_on_source(title: str, source_id: str) -> list:
-    """Search for a manga on a specific source."""
+    """Search for a manga on a specific source (cached for 5 minutes)."""
     query = """
     mutation FETCH_SOURCE_MANGA($input: FetchSourceMangaInput!) {
         fetchSourceManga(input: $input) {
@@ -336,39 +813,64 @@ def search_manga_on_source(title: str, source_id: str) -> list:
 
     try:
         result = graphql_request(query, variables)
-        return result.get("data", {}).get("fetchSourceManga", {}).get("mangas", [])
+        mangas = result.get("data", {}).get("fetchSourceManga", {}).get("mangas", [])
+        _source_breaker.record_success(source_id)
+        return mangas
     except Exception as e:
         logger.warning(f"Search failed on source {source_id}: {e}")
+        _source_breaker.record_failure(source_id)
         return []
 
 
+# Strips punctuation during title normalization (str.translate runs in C,
+# avoiding per-call regex overhead)
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Extracts the chapter number from a chapter name (compiled once, not per call)
+_CHAPTER_NUM_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(title: str) -> str:
+    """Normalize a title for comparison (lowercased, punctuation stripped)."""
+    return title.lower().strip().translate(_PUNCT_TABLE)
+
+
+@functools.lru_cache(maxsize=8192)
+def _similarity(norm1: str, norm2: str) -> float:
+    """Score two already-normalized titles (memoized for repeated pairs)."""
+    return fuzz.WRatio(norm1, norm2) / 100.0
+
+
 def title_similarity(title1: str, title2: str) -> float:
     """Calculate similarity between two titles."""
-    def normalize(t):
-        t = t.lower().strip()
-        t = re.sub(r'[^\w\s]', '', t)
-        return t
-
-    return SequenceMatcher(None, normalize(title1), normalize(title2)).ratio()
+    return _similarity(_normalize(title1), _normalize(title2))
 
 
 def find_best_match(original_title: str, search_results: list) -> dict:
     """Find the best matching manga from search results."""
-    best_match = None
-    best_score = 0
+    if not search_results:
+        return None
 
-    for manga in search_results:
-        score = title_similarity(original_title, manga["title"])
-        if score > best_score and score >= TITLE_MATCH_THRESHOLD:
-            best_score = score
-            best_match = manga
-            best_match["_match_score"] = score
+    result = process.extractOne(
+        original_title,
+        [manga["title"] for manga in search_results],
+        scorer=fuzz.WRatio,
+        processor=_normalize,
+        score_cutoff=TITLE_MATCH_THRESHOLD * 100
+    )
+    if not result:
+        return None
 
+    _, score, index = result
+    best_match = search_results[index]
+    best_match["_match_score"] = score / 100.0
     return best_match
 
 
+@_ttl_cache(maxsize=256, ttl=3600)
 def fetch_chapters(manga_id: int) -> list:
-    """Fetch chapters for a manga."""
+    """Fetch chapters for a manga (cached for an hour)."""
     query = """
     mutation FETCH_CHAPTERS($input: FetchChaptersInput!) {
         fetchChapters(input: $input) {
@@ -391,12 +893,15 @@ def fetch_chapters(manga_id: int) -> list:
         return []
 
 
-def find_matching_chapter(chapters: list, target_chapter_num: float) -> dict | None:
+@_ttl_cache(maxsize=256, ttl=3600)
+def _chapter_index(manga_id: int) -> dict:
+    """Chapters of a manga keyed by rounded chapter number for O(1) lookup."""
+    return {round(c["chapterNumber"], 2): c for c in fetch_chapters(manga_id)}
+
+
+def find_matching_chapter(chapter_index: dict, target_chapter_num: float) -> dict | None:
     """Find a chapter matching the target chapter number."""
-    for chapter in chapters:
-        if abs(chapter["chapterNumber"] - target_chapter_num) < 0.01:
-            return chapter
-    return None
+    return chapter_index.get(round(target_chapter_num, 2))
 
 
 def enqueue_download(chapter_id: int) -> bool:
@@ -420,29 +925,31 @@ def enqueue_download(chapter_id: int) -> bool:
 
 def start_download(chapter_id: int) -> bool:
     """Start downloading a chapter immediately (for parallel downloads)."""
+    # Enqueue and start in one GraphQL document: the server sequences the
+    # mutations, so no settling sleep or second round trip is needed
     query = """
-    mutation START_DOWNLOADS($input: StartDownloadsInput!) {
-        startDownloads(input: $input) {
+    mutation ENQUEUE_AND_START($enqueue: EnqueueChapterDownloadsInput!, $start: StartDownloadsInput!) {
+        enqueue: enqueueChapterDownloads(input: $enqueue) {
+            downloadStatus { state }
+        }
+        start: startDownloads(input: $start) {
             downloadStatus { state }
         }
     }
     """
-    variables = {"input": {"clientMutationId": str(chapter_id)}}
+    variables = {
+        "enqueue": {"ids": [chapter_id]},
+        "start": {"clientMutationId": str(chapter_id)}
+    }
 
     try:
-        # First enqueue, then start
+        graphql_request(query, variables)
+        return True
+    except Exception:
+        # START_DOWNLOADS might not exist in all versions, fallback to just enqueue
         if enqueue_download(chapter_id):
-            # Give a moment for enqueue to register
-            time.sleep(0.5)
-            try:
-                graphql_request(query, variables)
-            except Exception:
-                # START_DOWNLOADS might not exist in all versions, fallback to just enqueue
-                pass
             return True
-        return False
-    except Exception as e:
-        logger.error(f"Failed to start download for chapter {chapter_id}: {e}")
+        logger.error(f"Failed to start download for chapter {chapter_id}")
         return False
 
 
@@ -458,7 +965,7 @@ def dequeue_download(chapter_id: int) -> bool:
     variables = {"input": {"id": chapter_id}}
 
     try:
-        graphql_request(query, variables)
+        graphql_request(query, variables, retries=1)
         logger.info(f"    Dequeued chapter {chapter_id}")
         return True
     except Exception as e:
@@ -498,7 +1005,7 @@ def delete_downloaded_chapter(chapter_id: int) -> bool:
     variables = {"input": {"id": chapter_id}}
 
     try:
-        graphql_request(query, variables)
+        graphql_request(query, variables, retries=1)
         return True
     except Exception as e:
         logger.warning(f"Failed to delete chapter {chapter_id}: {e}")
@@ -506,8 +1013,15 @@ def delete_downloaded_chapter(chapter_id: int) -> bool:
 
 
 def wait_for_download(chapter_id: int, timeout: int = DOWNLOAD_WAIT_TIMEOUT) -> bool:
-    """Wait for a chapter download to complete."""
+    """Wait for a chapter download to complete.
+
+    Polls with exponential backoff (1s up to 16s) so short downloads are
+    detected quickly without hammering GraphQL for long ones; the interval
+    resets whenever progress advances.
+    """
     start_time = time.time()
+    interval = 1.0
+    last_progress = -1
 
     while time.time() - start_time < timeout:
         queue = get_download_status()
@@ -520,7 +1034,6 @@ def wait_for_download(chapter_id: int, timeout: int = DOWNLOAD_WAIT_TIMEOUT) ->
 
         # If not present in queue anymore, assume finished
         if chapter_status is None:
-            time.sleep(2)
             return True
 
         if chapter_status["state"] == "FINISHED":
@@ -530,18 +1043,24 @@ def wait_for_download(chapter_id: int, timeout: int = DOWNLOAD_WAIT_TIMEOUT) ->
 
         progress = chapter_status.get("progress", 0)
         logger.info(f"    Download progress: {progress}%")
-        time.sleep(DOWNLOAD_CHECK_INTERVAL)
+        if progress != last_progress:
+            last_progress = progress
+            interval = 1.0
+        else:
+            interval = min(interval * 1.5, 16.0)
+        time.sleep(interval)
 
     logger.warning(f"    Download timeout after {timeout}s")
     return False
 
 
-def check_active_downloads() -> dict:
+def check_active_downloads(queue: list = None) -> dict:
     """Check status of all active fallback downloads and return completed ones."""
     if not _active_fallback_downloads:
         return {}
 
-    queue = get_download_status()
+    if queue is None:
+        queue = get_download_status()
     queue_by_id = {item["chapter"]["id"]: item for item in queue}
     
     completed = {}
@@ -567,12 +1086,14 @@ def check_active_downloads() -> dict:
             logger.warning(f"    Fallback download failed for chapter {chapter_id} ({info['original_manga_title']} - {info['original_chapter_name']})")
             timed_out.append(chapter_id)
 
-    # Clean up completed and failed
+    # Clean up completed and failed, freeing their fallback slots
     for chapter_id in completed:
         del _active_fallback_downloads[chapter_id]
+        _fallback_slots.release()
     for chapter_id in timed_out:
         if chapter_id in _active_fallback_downloads:
             del _active_fallback_downloads[chapter_id]
+            _fallback_slots.release()
 
     return completed
 
@@ -586,18 +1107,30 @@ def list_existing_manga_folders(manga_title: str) -> list[tuple[str, str, int]]:
     if not os.path.exists(DOWNLOADS_PATH):
         return matches
 
-    for source_folder in os.listdir(DOWNLOADS_PATH):
-        source_path = os.path.join(DOWNLOADS_PATH, source_folder)
-        if not os.path.isdir(source_path):
+    # Normalize the manga title once rather than per folder comparison
+    norm_title = _normalize(manga_title)
+
+    exact_match = None
+    for source_entry in _cached_scandir(DOWNLOADS_PATH):
+        if not source_entry.is_dir():
             continue
         # look for exact or similar title folder
-        for folder in os.listdir(source_path):
-            folder_path = os.path.join(source_path, folder)
-            if not os.path.isdir(folder_path):
+        for folder_entry in _cached_scandir(source_entry.path):
+            if not folder_entry.is_dir():
                 continue
-            if title_similarity(folder, manga_title) >= TITLE_MATCH_THRESHOLD:
-                cbz_count = len([f for f in os.listdir(folder_path) if f.lower().endswith(".cbz")])
-                matches.append((source_folder, folder_path, cbz_count))
+            norm_folder = _normalize(folder_entry.name)
+            if fuzz.WRatio(norm_folder, norm_title, score_cutoff=TITLE_MATCH_THRESHOLD * 100):
+                cbz_count = sum(
+                    1 for e in _cached_scandir(folder_entry.path)
+                    if e.name.lower().endswith(".cbz") and e.is_file()
+                )
+                matches.append((source_entry.name, folder_entry.path, cbz_count))
+                if norm_folder == norm_title:
+                    exact_match = matches[-1]
+        if exact_match:
+            # An exact-title folder was found; no need to scan the
+            # remaining source folders for fuzzy matches
+            break
     return matches
 
 
@@ -621,6 +1154,28 @@ def resolve_destination_source_id(manga_title: str, default_source_id: str) -> s
     return default_source_id
 
 
+@functools.lru_cache(maxsize=128)
+def _index_cbz_dir(path: str, mtime_ns: int) -> tuple:
+    """Index the CBZ files of a manga folder in one scandir pass.
+
+    Returns (entries, by_number) where entries is a tuple of
+    (filename, filepath) pairs and by_number maps the first chapter number
+    found in each filename to its path. Keyed by the directory mtime so
+    the cache invalidates when files are added or removed.
+    """
+    entries = []
+    by_number = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.name.lower().endswith('.cbz'):
+                continue
+            entries.append((entry.name, entry.path))
+            num_match = _CHAPTER_NUM_RE.search(entry.name)
+            if num_match:
+                by_number.setdefault(num_match.group(1), entry.path)
+    return tuple(entries), by_number
+
+
 def find_cbz_file(source_id: str, manga_title: str, chapter_name: str) -> str | None:
     """Find the downloaded CBZ file."""
     source_folder = get_source_folder(source_id)
@@ -629,28 +1184,37 @@ def find_cbz_file(source_id: str, manga_title: str, chapter_name: str) -> str |
     if not os.path.exists(manga_path):
         source_path = os.path.join(DOWNLOADS_PATH, source_folder)
         if os.path.exists(source_path):
-            for folder in os.listdir(source_path):
-                if title_similarity(folder, manga_title) >= TITLE_MATCH_THRESHOLD:
-                    manga_path = os.path.join(source_path, folder)
+            for entry in _cached_scandir(source_path):
+                if entry.is_dir() and title_similarity(entry.name, manga_title) >= TITLE_MATCH_THRESHOLD:
+                    manga_path = entry.path
                     break
 
     if not os.path.exists(manga_path):
         logger.warning(f"    Manga folder not found: {manga_path}")
         return None
 
+    try:
+        mtime_ns = os.stat(manga_path).st_mtime_ns
+    except OSError:
+        return None
+    cbz_entries, by_number = _index_cbz_dir(manga_path, mtime_ns)
+
     # Try filename contains chapter_name
-    for filename in os.listdir(manga_path):
-        if filename.lower().endswith('.cbz'):
-            if chapter_name in filename or chapter_name.replace(" ", "") in filename:
-                return os.path.join(manga_path, filename)
+    compact_name = chapter_name.replace(" ", "")
+    for filename, filepath in cbz_entries:
+        if chapter_name in filename or compact_name in filename:
+            return filepath
 
     # Fallback: match by chapter number
-    chapter_num_match = re.search(r'(\d+(?:\.\d+)?)', chapter_name)
+    chapter_num_match = _CHAPTER_NUM_RE.search(chapter_name)
     if chapter_num_match:
         chapter_num = chapter_num_match.group(1)
-        for filename in os.listdir(manga_path):
-            if filename.lower().endswith('.cbz') and chapter_num in filename:
-                return os.path.join(manga_path, filename)
+        hit = by_number.get(chapter_num)
+        if hit:
+            return hit
+        for filename, filepath in cbz_entries:
+            if chapter_num in filename:
+                return filepath
 
     return None
 
@@ -671,10 +1235,22 @@ def copy_and_rename_cbz(source_file: str, dest_source_id: str, manga_title: str,
 
     try:
         os.makedirs(dest_manga_path, exist_ok=True)
-        shutil.copy2(source_file, dest_path)
-        # Normalize ownership to avoid mixed root/1000
         try:
-            os.chown(dest_path, CHOWN_UID, CHOWN_GID)
+            # The alt-source copy is deleted right after finalize anyway,
+            # so a same-filesystem rename moves the data for free
+            os.replace(source_file, dest_path)
+        except OSError:
+            # Cross-device: copyfile uses the kernel sendfile/
+            # copy_file_range fast path and skips metadata we don't need
+            shutil.copyfile(source_file, dest_path)
+        _dir_cache.pop(dest_manga_path, None)
+        _dir_cache.pop(os.path.dirname(source_file), None)
+        # Normalize ownership to avoid mixed root/1000 (skip the chown
+        # when the file already has the right owner)
+        try:
+            st = os.stat(dest_path)
+            if st.st_uid != CHOWN_UID or st.st_gid != CHOWN_GID:
+                os.chown(dest_path, CHOWN_UID, CHOWN_GID)
         except Exception as e:
             logger.warning(f"    Could not chown {dest_path} to {CHOWN_UID}:{CHOWN_GID}: {e}")
         logger.info(f"    Copied to: {dest_path}")
@@ -684,29 +1260,62 @@ def copy_and_rename_cbz(source_file: str, dest_source_id: str, manga_title: str,
         return False
 
 
+def _fast_rmtree(path: str) -> None:
+    """Remove a directory tree, unlinking its files in parallel.
+
+    unlink releases the GIL during the syscall, so a small worker pool
+    overlaps the per-file waits; manga folders are flat lists of CBZ
+    files, subdirectories (rare) recurse first.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    files = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _fast_rmtree(entry.path)
+        else:
+            files.append(entry.path)
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+            list(ex.map(os.unlink, files))
+    elif files:
+        os.unlink(files[0])
+    os.rmdir(path)
+
+
+def _dir_is_empty(path: str) -> bool:
+    """Check emptiness with scandir, stopping at the first entry."""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+
 def delete_alt_source_files(source_id: str, manga_title: str, cbz_file: str = None) -> bool:
     """Delete the specific CBZ file or alt source manga folder to save space."""
     source_folder = get_source_folder(source_id)
     manga_path = os.path.join(DOWNLOADS_PATH, source_folder, manga_title)
 
     try:
-        # If a specific CBZ file is provided, only delete that file
-        if cbz_file and os.path.exists(cbz_file):
-            os.remove(cbz_file)
-            logger.info(f"    Deleted CBZ file: {cbz_file}")
-            
+        # If a specific CBZ file is provided, only delete that file (it may
+        # already be gone when finalize moved it to the destination)
+        if cbz_file:
+            if os.path.exists(cbz_file):
+                os.remove(cbz_file)
+                _dir_cache.pop(manga_path, None)
+                logger.info(f"    Deleted CBZ file: {cbz_file}")
+
             # Only delete the manga folder if it's now empty
-            if os.path.exists(manga_path) and not os.listdir(manga_path):
+            if os.path.exists(manga_path) and _dir_is_empty(manga_path):
                 os.rmdir(manga_path)
                 logger.info(f"    Deleted empty manga folder: {manga_path}")
         elif os.path.exists(manga_path):
             # Fallback: delete entire folder if no specific file provided
-            shutil.rmtree(manga_path)
+            _fast_rmtree(manga_path)
+            _dir_cache.pop(manga_path, None)
             logger.info(f"    Deleted alt source folder: {manga_path}")
 
         # Clean up empty source folder
         source_path = os.path.join(DOWNLOADS_PATH, source_folder)
-        if os.path.exists(source_path) and not os.listdir(source_path):
+        if os.path.exists(source_path) and _dir_is_empty(source_path):
             os.rmdir(source_path)
 
         return True
@@ -715,8 +1324,42 @@ def delete_alt_source_files(source_id: str, manga_title: str, cbz_file: str = No
         return False
 
 
-def start_fallback_download(failed_item: dict, tried_sources: list = None, failure_key: str = None) -> bool:
-    """Start a fallback download for a failed chapter (non-blocking)."""
+# Post-recovery cleanup (file deletions, often seconds on large folders) runs
+# here so finalize_fallback_download can hand control back to the main loop
+# right after the CBZ lands in the destination folder
+_cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cleanup")
+atexit.register(_cleanup_executor.shutdown, wait=True)
+
+
+def _cleanup_after_recovery(source_id: str, manga_title: str, cbz_file: str, chapter_id: int) -> None:
+    """Delete the alt-source leftovers for a recovered chapter."""
+    delete_alt_source_files(source_id, manga_title, cbz_file)
+    delete_downloaded_chapter(chapter_id)
+
+
+def start_fallback_download(failed_item: dict, tried_sources: set = None, failure_key: str = None):
+    """Start a fallback download for a failed chapter (non-blocking).
+
+    Returns the source ID a download was started from, None if no
+    alternative source worked, or False if all fallback slots are busy.
+    """
+    # Slot-accurate concurrency gate: the slot stays held for as long as
+    # the download is tracked in _active_fallback_downloads
+    if not _fallback_slots.acquire(blocking=False):
+        logger.debug("All fallback slots busy, deferring new fallback start")
+        return False
+
+    source_id = None
+    try:
+        source_id = _start_fallback_download(failed_item, tried_sources, failure_key)
+        return source_id
+    finally:
+        if not source_id:
+            _fallback_slots.release()
+
+
+def _start_fallback_download(failed_item: dict, tried_sources: set, failure_key: str):
+    """Resolve destination and alt sources for a failed chapter and start a download."""
     manga_title = failed_item["manga"]["title"]
     manga_id = failed_item["manga"]["id"]
     failed_source_id = failed_item["manga"]["sourceId"]
@@ -724,6 +1367,14 @@ def start_fallback_download(failed_item: dict, tried_sources: list = None, failu
     chapter_name = failed_item["chapter"]["name"]
     failed_chapter_id = failed_item["chapter"]["id"]
 
+    # The failed queue item already carries name and scanlator, so the
+    # expected destination filename needs no extra chapter query later
+    if "scanlator" in failed_item["chapter"]:
+        _expected_filename_cache.setdefault(
+            failed_chapter_id,
+            _build_expected_filename(chapter_name, failed_item["chapter"]["scanlator"])
+        )
+
     failed_source_name = get_source_name(failed_source_id)
 
     logger.info(f"Processing failed download: {manga_title} - {chapter_name}")
@@ -734,24 +1385,53 @@ def start_fallback_download(failed_item: dict, tried_sources: list = None, failu
     dest_source_name = get_source_name(dest_source_id)
     if dest_source_id != failed_source_id:
         logger.info(f"  Overriding destination to existing source: {dest_source_name}")
+    if failure_key:
+        _dest_source_by_failure[failure_key] = dest_source_id
 
-    # Initialize tried sources list if not provided
+    # Initialize tried sources set if not provided
     if tried_sources is None:
-        tried_sources = []
+        tried_sources = set()
 
+    # Skip the destination source, already tried sources, and sources whose
+    # circuit breaker is currently open (consistently failing)
+    candidates = []
     for source_id in SOURCE_PRIORITY:
-        # Skip the destination source when searching alt sources
-        if source_id == dest_source_id:
+        if source_id == dest_source_id or source_id in tried_sources:
             continue
-        
-        # Skip already tried sources
-        if source_id in tried_sources:
+        if not _source_breaker.allow(source_id):
+            logger.debug(f"  Skipping source {source_id}: circuit breaker open")
             continue
+        candidates.append(source_id)
+    if not candidates:
+        logger.warning(f"  ✗ Could not find alternative source for {manga_title} - {chapter_name}")
+        return None
+
+    # Fan the source searches out in parallel; results are still consumed
+    # in SOURCE_PRIORITY order so earlier sources keep precedence.
+    executor = ThreadPoolExecutor(max_workers=min(4, len(candidates)))
+    try:
+        search_futures = {
+            source_id: executor.submit(search_manga_on_source, manga_title, source_id)
+            for source_id in candidates
+        }
+        return _pick_fallback_source(
+            candidates, search_futures, manga_title, chapter_name, chapter_num,
+            dest_source_id, failed_chapter_id, tried_sources, failure_key
+        )
+    finally:
+        # Don't block on searches for lower-priority sources we no longer need
+        executor.shutdown(wait=False, cancel_futures=True)
 
+
+def _pick_fallback_source(candidates: list, search_futures: dict, manga_title: str,
+                          chapter_name: str, chapter_num: float, dest_source_id: str,
+                          failed_chapter_id: int, tried_sources: set, failure_key: str):
+    """Walk candidate sources in priority order and start the first viable download."""
+    for source_id in candidates:
         source_name = get_source_name(source_id)
         logger.info(f"  Trying source: {source_name}")
 
-        search_results = search_manga_on_source(manga_title, source_id)
+        search_results = search_futures[source_id].result()
         if not search_results:
             logger.info(f"    No results found")
             continue
@@ -763,12 +1443,12 @@ def start_fallback_download(failed_item: dict, tried_sources: list = None, failu
 
         logger.info(f"    Found match: {match['title']} (score: {match.get('_match_score', 0):.2f})")
 
-        chapters = fetch_chapters(match["id"])
-        if not chapters:
+        chapter_index = _chapter_index(match["id"])
+        if not chapter_index:
             logger.info(f"    No chapters found")
             continue
 
-        target_chapter = find_matching_chapter(chapters, chapter_num)
+        target_chapter = find_matching_chapter(chapter_index, chapter_num)
         if not target_chapter:
             logger.info(f"    Chapter {chapter_num} not found")
             continue
@@ -777,7 +1457,7 @@ def start_fallback_download(failed_item: dict, tried_sources: list = None, failu
 
         # Start the download (non-blocking)
         if not start_download(target_chapter["id"]):
-            tried_sources.append(source_id)
+            tried_sources.add(source_id)
             continue
 
         # Track this download
@@ -818,10 +1498,14 @@ def finalize_fallback_download(chapter_id: int, info: dict, manga_id: int = None
 
     logger.info(f"Finalizing fallback download: {original_manga_title} - {original_chapter_name}")
 
-    # Give filesystem a moment to finalize
-    time.sleep(2)
-
-    cbz_file = find_cbz_file(source_id, manga_title, chapter_name)
+    # The file can lag the queue state by a moment; retry discovery briefly
+    # instead of sleeping a fixed 2s
+    cbz_file = None
+    for _ in range(10):
+        cbz_file = find_cbz_file(source_id, manga_title, chapter_name)
+        if cbz_file:
+            break
+        time.sleep(0.2)
 
     if not cbz_file:
         logger.warning(f"    Could not find downloaded CBZ file from {source_name}")
@@ -834,14 +1518,16 @@ def finalize_fallback_download(chapter_id: int, info: dict, manga_id: int = None
     if not copy_and_rename_cbz(cbz_file, dest_source_id, original_manga_title, original_chapter_name, failed_chapter_id):
         return False
 
-    # Clean up alt source files - only delete the specific CBZ file to avoid conflicts with parallel downloads
-    delete_alt_source_files(source_id, manga_title, cbz_file)
-    delete_downloaded_chapter(chapter_id)
+    # Clean up alt source files in the background - only the specific CBZ file
+    # is targeted to avoid conflicts with parallel downloads, and deferring the
+    # deletions lets the loop move on to the next failure immediately
+    _cleanup_executor.submit(_cleanup_after_recovery, source_id, manga_title, cbz_file, chapter_id)
 
     # The key: Dequeue the ERROR chapter, then re-enqueue it
-    # When Suwayomi's downloader processes it, it will find the file exists and mark as downloaded
+    # When Suwayomi's downloader processes it, it will find the file exists
+    # and mark as downloaded (the backend serializes these per chapter id,
+    # so no settling sleep is needed in between)
     dequeue_download(failed_chapter_id)
-    time.sleep(1)
     enqueue_to_mark_downloaded(failed_chapter_id)
 
     logger.info(f"  ✓ Successfully recovered {original_chapter_name} into {dest_source_name}")
@@ -860,21 +1546,43 @@ def main():
     logger.info(f"Max source retry loops: {MAX_SOURCE_RETRY_LOOPS}")
     logger.info("=" * 60)
     
-    # Check for updates on startup
-    check_for_updates()
-
-    processed_failures = set()
-    # Track tried sources per failure: {failure_key: {"sources": [source_ids], "original_source": source_id, "loops": int}}
+    # Check for updates on startup (in the background, so a slow GitHub
+    # response doesn't delay failure processing)
+    if CHECK_FOR_UPDATES:
+        threading.Thread(target=check_for_updates, daemon=True).start()
+
+    # Warm the source-name caches: one extensions listing covers every
+    # installed source; if that fails, fall back to an aliased query for
+    # just the configured priority sources
+    if not _prime_source_caches():
+        prefetch_source_names(SOURCE_PRIORITY)
+
+    processed_failures = _processed_failures_store()
+    # Track tried sources per failure: {failure_key: {"sources": {source_ids}, "original_source": source_id, "loops": int}}
     tried_sources_per_failure = {}
     # Track which failures have been successfully recovered and are waiting for Suwayomi to detect the file
     pending_detection = set()
     # Track when items were added to pending_detection for timeout handling
     pending_detection_times = {}
 
+    # Adaptive polling state: poll quickly while fallbacks are in flight,
+    # back off exponentially after consecutive idle ticks
+    poll_interval = CHECK_INTERVAL
+    idle_ticks = 0
+
     while True:
+        had_activity = False
         try:
+            # One queue snapshot per tick, shared by the active-download
+            # tracking, the pending-detection cleanup and the failure scan
+            queue = get_download_queue()
+
             # Check and finalize any completed fallback downloads
-            completed = check_active_downloads()
+            completed = check_active_downloads(queue)
+            if completed:
+                had_activity = True
+                # One aliased query for every filename the finalizers need
+                prefetch_expected_filenames([info["failed_chapter_id"] for info in completed.values()])
             for chapter_id, info in completed.items():
                 try:
                     success = finalize_fallback_download(chapter_id, info)
@@ -887,13 +1595,14 @@ def main():
                             # Clean up source tracking for this failure
                             if failure_key in tried_sources_per_failure:
                                 del tried_sources_per_failure[failure_key]
+                            _dest_source_by_failure.pop(failure_key, None)
                 except Exception as e:
                     logger.exception(f"Error finalizing download for chapter {chapter_id}: {e}")
 
             # Clean up pending_detection for items no longer in failed state or timed out
             if pending_detection:
-                failed_downloads_check = get_failed_downloads()
-                failed_keys = {f"{item['manga']['id']}_{item['chapter']['id']}" for item in failed_downloads_check}
+                failed_downloads_check = get_failed_downloads(queue)
+                failed_keys = {item["_key"] for item in failed_downloads_check}
                 current_time = time.time()
                 
                 for failure_key in list(pending_detection):
@@ -910,78 +1619,99 @@ def main():
                         pending_detection_times.pop(failure_key, None)
                         processed_failures.add(failure_key)
 
-            # Check for new failures and start fallback downloads if under limit
-            if len(_active_fallback_downloads) < MAX_CONCURRENT_FALLBACKS:
-                failed_downloads = get_failed_downloads()
-
-                if failed_downloads:
-                    new_failures = [
-                        item for item in failed_downloads
-                        if f"{item['manga']['id']}_{item['chapter']['id']}" not in processed_failures
-                        and f"{item['manga']['id']}_{item['chapter']['id']}" not in pending_detection
-                    ]
-
-                    if new_failures:
-                        # Start fallback downloads up to the concurrent limit
-                        available_slots = MAX_CONCURRENT_FALLBACKS - len(_active_fallback_downloads)
-                        to_process = new_failures[:available_slots]
-
-                        if to_process:
-                            logger.info(f"Found {len(new_failures)} new failed downloads, starting {len(to_process)}")
-
-                            for item in to_process:
-                                failure_key = f"{item['manga']['id']}_{item['chapter']['id']}"
-                                try:
-                                    # Initialize tracking for this failure if first time
-                                    if failure_key not in tried_sources_per_failure:
-                                        tried_sources_per_failure[failure_key] = {
-                                            "sources": [],
-                                            "original_source": item['manga']['sourceId'],  # Store ORIGINAL source
-                                            "loops": 0
-                                        }
-                                    
-                                    failure_info = tried_sources_per_failure[failure_key]
-                                    tried = failure_info["sources"]
-                                    
-                                    # Override item's sourceId with the original one for correct file placement
-                                    item['manga']['sourceId'] = failure_info["original_source"]
-                                    
-                                    # Try to start download, passing tried sources and failure_key
-                                    result = start_fallback_download(item, tried, failure_key)
-                                    
-                                    if result:  # Returns source_id on success
-                                        # Track this source as tried
-                                        failure_info["sources"].append(result)
+            # Check for new failures and start fallback downloads; the
+            # semaphore in start_fallback_download enforces the limit
+            failed_downloads = get_failed_downloads(queue)
+
+            if failed_downloads:
+                new_failures = [
+                    item for item in failed_downloads
+                    if item["_key"] not in processed_failures
+                    and item["_key"] not in pending_detection
+                ]
+
+                if new_failures:
+                    had_activity = True
+                    logger.info(f"Found {len(new_failures)} new failed downloads")
+
+                    for item in new_failures:
+                        failure_key = item["_key"]
+                        try:
+                            # Initialize tracking for this failure if first time
+                            if failure_key not in tried_sources_per_failure:
+                                tried_sources_per_failure[failure_key] = {
+                                    "sources": set(),
+                                    "original_source": item['manga']['sourceId'],  # Store ORIGINAL source
+                                    "loops": 0
+                                }
+
+                            failure_info = tried_sources_per_failure[failure_key]
+                            tried = failure_info["sources"]
+
+                            # Override item's sourceId with the original one for correct file placement
+                            item['manga']['sourceId'] = failure_info["original_source"]
+
+                            # Try to start download, passing tried sources and failure_key
+                            result = start_fallback_download(item, tried, failure_key)
+
+                            if result is False:
+                                # No free fallback slot; retry the remaining failures next tick
+                                break
+
+                            if result:  # Returns source_id on success
+                                # Track this source as tried
+                                failure_info["sources"].add(result)
+                            else:
+                                # Check if we've tried all non-destination sources;
+                                # the set difference is duplicate-proof, unlike a
+                                # length comparison on an append-only list. Subtract
+                                # the resolved destination (which candidates exclude),
+                                # not the original source it may have overridden.
+                                dest_source = _dest_source_by_failure.get(failure_key, failure_info["original_source"])
+                                remaining = set(SOURCE_PRIORITY) - tried - {dest_source}
+                                if not remaining:
+                                    failure_info["loops"] += 1
+
+                                    # Check if we've exhausted our retry loops
+                                    if failure_info["loops"] >= MAX_SOURCE_RETRY_LOOPS:
+                                        logger.info(f"  All sources exhausted after {failure_info['loops']} loops for {failure_key}, marking as processed")
+                                        processed_failures.add(failure_key)
+                                        del tried_sources_per_failure[failure_key]
+                                        _dest_source_by_failure.pop(failure_key, None)
                                     else:
-                                        # Check if we've tried all sources
-                                        if len(tried) >= len(SOURCE_PRIORITY) - 1:  # -1 for dest source
-                                            failure_info["loops"] += 1
-                                            
-                                            # Check if we've exhausted our retry loops
-                                            if failure_info["loops"] >= MAX_SOURCE_RETRY_LOOPS:
-                                                logger.info(f"  All sources exhausted after {failure_info['loops']} loops for {failure_key}, marking as processed")
-                                                processed_failures.add(failure_key)
-                                            else:
-                                                # Reset tried sources to start a new loop
-                                                logger.info(f"  Completed loop {failure_info['loops']}/{MAX_SOURCE_RETRY_LOOPS}, retrying all sources")
-                                                failure_info["sources"] = []
-                                        else:
-                                            logger.debug(f"Will retry {failure_key} with remaining sources")
-                                    time.sleep(2)  # Small delay between starts
-                                except Exception as e:
-                                    logger.exception(f"Error starting fallback for {item['manga']['title']}: {e}")
-            else:
-                logger.debug(f"Max concurrent fallbacks reached ({len(_active_fallback_downloads)}/{MAX_CONCURRENT_FALLBACKS}), skipping new starts")
-
-            # Periodic cleanup
-            if len(processed_failures) > 1000:
-                processed_failures.clear()
-                tried_sources_per_failure.clear()
+                                        # Reset tried sources to start a new loop
+                                        logger.info(f"  Completed loop {failure_info['loops']}/{MAX_SOURCE_RETRY_LOOPS}, retrying all sources")
+                                        failure_info["sources"] = set()
+                                else:
+                                    logger.debug(f"Will retry {failure_key} with remaining sources")
+                            time.sleep(2)  # Small delay between starts
+                        except Exception as e:
+                            logger.exception(f"Error starting fallback for {item['manga']['title']}: {e}")
 
         except Exception as e:
             logger.exception(f"Error in main loop: {e}")
 
-        time.sleep(CHECK_INTERVAL)
+        if _active_fallback_downloads:
+            # Downloads in flight: poll at the download-progress cadence,
+            # but never sleep past the earliest timeout deadline
+            next_deadline = min(
+                info["start_time"] + DOWNLOAD_WAIT_TIMEOUT
+                for info in _active_fallback_downloads.values()
+            )
+            poll_interval = max(1.0, min(DOWNLOAD_CHECK_INTERVAL, next_deadline - time.time()))
+            idle_ticks = 0
+        elif had_activity:
+            poll_interval = CHECK_INTERVAL
+            idle_ticks = 0
+        else:
+            idle_ticks += 1
+            if idle_ticks < 3:
+                poll_interval = CHECK_INTERVAL
+            else:
+                # Quiet for a while: back off up to 4x the base interval
+                poll_interval = min(max(poll_interval, CHECK_INTERVAL) * 2, CHECK_INTERVAL * 4)
+
+        time.sleep(poll_interval)
 
 
 if __name__ == "__main__":